@@ -3,9 +3,12 @@ Base agent class that all specialized agents will inherit from.
 Provides common functionality like memory and tool usage
 """
 
-from langchain.memory import ConversationBufferMemory
-from langchain.agents import AgentExecutor, create_react_agent
-from langchain.prompts import PromptTemplate
+import asyncio
+
+import numpy as np
+from langchain.memory import ConversationSummaryBufferMemory
+from langchain.agents import AgentExecutor, create_tool_calling_agent
+from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from typing import List, Dict, Any
 
 class BaseAgent:
@@ -18,39 +21,29 @@ class BaseAgent:
     - A specific role/purpose
     """
 
-    def __init__(self, llm, tools: List = None, role: str = "Assistant"):
+    def __init__(self, llm, tools: List = None, role: str = "Assistant",
+                 embeddings=None, cache_threshold: float = 0.97):
         self.llm = llm
         self.tools = tools or []
         self.role = role
-        self.memory = ConversationBufferMemory(
+
+        #Semantic cache: when an embeddings model is supplied, queries that
+        #are near-duplicates of something we already answered (cosine above
+        #the threshold) return the stored answer without touching the LLM
+        self.embeddings = embeddings
+        self.cache_threshold = cache_threshold
+        self._cache_vectors = None  #unit-norm query embeddings, one row each
+        self._cache_answers = []
+        #Summarize older turns past the token cap, so prompt size (and
+        #per-call latency/cost) stays bounded no matter how long the
+        #conversation runs
+        self.memory = ConversationSummaryBufferMemory(
+            llm=self.llm,
+            max_token_limit=1500,
             memory_key="chat_history",
             return_messages=True
         )
 
-        #ReAct pattern: Reason + Act
-
-        self.prompt_template = """
-        You are a {role}.
-
-        You have access to the following tools:
-        {tools}
-
-        Use the following format:
-        Thought: Think about what you need to do
-        Action: The action to take, should be one of [{tool_names}]
-        Action Input: The input to the action
-        Observation: The result of the action
-        ... repeat (Thought/Action/Action Input/Observation as needed)
-        Thought: I now know the final answer
-        Final Answer: The answer answer to the original input question
-
-        Previous conversation:
-        {chat_history}
-
-        Question: {input}
-        {agent_scratchpad}
-        """
-
         self.agent = None
         self._setup_agent()
 
@@ -58,19 +51,17 @@ class BaseAgent:
     def _setup_agent(self):
         """Initialize the agent with LLM and tools"""
         if self.tools:
-            prompt = PromptTemplate(
-                template = self.prompt_template,
-                input_variables = ["input", "chat_history", "agent_scratchpad"],
-                partial_variables = {
-                    "role": self.role,
-                    "tools": "\n".join(f"{t.name}: {t.description}" for t in self.tools),
-                    "tool_names": ", ".join([t.name for t in self.tools])
-                }   
-            )
-
-
-        
-            agent = create_react_agent(
+            #Native function calling: the model emits a tool_calls array
+            #in one turn, so it can request several tools at once instead
+            #of one text-parsed Action per step
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", f"You are a {self.role}. Use the available tools when they help answer the question."),
+                MessagesPlaceholder("chat_history"),
+                ("human", "{input}"),
+                MessagesPlaceholder("agent_scratchpad")
+            ])
+
+            agent = create_tool_calling_agent(
                 llm = self.llm,
                 tools = self.tools,
                 prompt = prompt
@@ -80,24 +71,103 @@ class BaseAgent:
                 agent=agent,
                 tools=self.tools,
                 memory = self.memory,
-                verbose=True,
-                handle_parsing_errors = True
+                verbose=True
             )
 
+    def _cache_lookup(self, input_text: str):
+        """
+        Check the semantic cache for a near-duplicate query
+
+        Returns (cached_answer_or_None, query_vector_or_None)
+        """
+        if self.embeddings is None:
+            return None, None
+
+        vector = np.array(self.embeddings.embed_query(input_text))
+        vector = vector / np.linalg.norm(vector)
+
+        if self._cache_vectors is not None:
+            #Rows are unit-norm, so the dot product is cosine similarity
+            similarities = self._cache_vectors @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] > self.cache_threshold:
+                return self._cache_answers[best], vector
+
+        return None, vector
+
+    def _cache_store(self, vector, answer: str):
+        """Remember a query vector and its answer for future near-hits"""
+        if vector is None:
+            return
+        if self._cache_vectors is None:
+            self._cache_vectors = vector.reshape(1, -1)
+        else:
+            self._cache_vectors = np.vstack([self._cache_vectors, vector])
+        self._cache_answers.append(answer)
+
+    def stream(self, input_text: str):
+        """
+        Execute the agent, yielding response chunks as they are produced
+
+        Callers see output as soon as the first chunk lands instead of
+        waiting for the full response; run() joins the same stream
+        """
+        cached, query_vector = self._cache_lookup(input_text)
+        if cached is not None:
+            yield cached
+            return
+
+        pieces = []
+
+        if self.agent:
+            try:
+                for event in self.agent.stream({"input": input_text}):
+                    # Intermediate events carry actions/steps; only the
+                    # final one has the output text
+                    if "output" in event:
+                        pieces.append(event["output"])
+                        yield event["output"]
+            except Exception as e:
+                # Handle cases where the agent doesn't produce an output
+                yield f"An error occurred during agent execution: {e}"
+                return
+        else:
+            #no tool = not an agent, so stream straight from the LLM
+            for chunk in self.llm.stream(input_text):
+                text = chunk.content if hasattr(chunk, "content") else str(chunk)
+                pieces.append(text)
+                yield text
+
+        self._cache_store(query_vector, "".join(pieces))
+
     def run(self, input_text: str) -> str:
         """Execute the agent with given input """
+        return "".join(self.stream(input_text)) or "No output found"
+
+    async def arun(self, input_text: str) -> str:
+        """
+        Async version of run
+
+        Going through ainvoke lets the AgentExecutor execute the tool calls
+        of a step with asyncio.gather, so independent tools in one turn run
+        concurrently instead of back to back
+        """
         if self.agent:
             try:
-                response = self.agent.invoke({"input": input_text})
-                # Check for the correct output key
+                response = await self.agent.ainvoke({"input": input_text})
                 return response.get("output", "No output found")
             except Exception as e:
-                # Handle cases where the agent doesn't produce an output
                 return f"An error occurred during agent execution: {e}"
         else:
             #no tool = not an agent, so just use LLM
-            return self.llm.predict(input_text)
-        
+            return (await self.llm.apredict(input_text))
+
+    async def arun_many(self, inputs: List[str]) -> List[str]:
+        """Run several independent inputs concurrently"""
+        return await asyncio.gather(*[self.arun(text) for text in inputs])
+
     def clear_memory(self):
-        """Reset conversation memory"""
+        """Reset conversation memory and the semantic cache"""
         self.memory.clear()
+        self._cache_vectors = None
+        self._cache_answers = []
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -6,6 +7,60 @@ from langchain_openai import OpenAIEmbeddings
 
 load_dotenv()
 
+
+# Cached factories: constructing a client validates keys and spins up an
+# httpx client + tokenizer, so build each (model, temperature) combo once
+# and hand the same instance back on later calls
+
+@lru_cache(maxsize=8)
+def _make_gpt4(api_key, temperature):
+    return ChatOpenAI(
+        model_name = "gpt-5-mini",
+        temperature = temperature,
+        openai_api_key=api_key
+    )
+
+
+@lru_cache(maxsize=8)
+def _make_claude(api_key, temperature):
+    return ChatAnthropic(
+        model_name = "claude-sonnet-4-20250514",
+        temperature = temperature,
+        anthropic_api_key=api_key
+    )
+
+
+class CachedQueryEmbeddings:
+    """
+    Wraps an embeddings model with an exact-string cache on embed_query.
+    The same query strings recur across searches (and across the vector
+    stores), so repeats return the stored vector instead of re-calling
+    the embedding API. Everything else delegates to the wrapped model
+    """
+
+    def __init__(self, inner, maxsize=1024):
+        self._inner = inner
+        self._cached_embed_query = lru_cache(maxsize=maxsize)(inner.embed_query)
+
+    def embed_query(self, text):
+        return self._cached_embed_query(text)
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+@lru_cache(maxsize=1)
+def _make_embeddings(api_key):
+    return CachedQueryEmbeddings(OpenAIEmbeddings(
+        openai_api_key=api_key,
+        model="text-embedding-3-small",
+        chunk_size=2048,
+        show_progress_bar=False,
+        retry_min_seconds=1,
+        retry_max_seconds=30
+    ))
+
+
 class LLMConfig:
     # Manages LLM configurations and model initialization
 
@@ -26,12 +81,8 @@ class LLMConfig:
         Temperature controls creavitity(0 = deterministic, 1 = creative)
         """
 
-        return ChatOpenAI(
-            model_name = "gpt-5-mini",
-            temperature = temperature,
-            openai_api_key=self.openai_api_key
-        )
-    
+        return _make_gpt4(self.openai_api_key, temperature)
+
 
     def get_claude(self, temperature = 0.7):
         """
@@ -39,16 +90,16 @@ class LLMConfig:
         Claude excels at detailed analsysis and fact-checking
         """
 
-        return ChatAnthropic(
-            model_name = "claude-sonnet-4-20250514",
-            temperature = temperature,
-            anthropic_api_key=self.anthropic_api_key
-        )
-    
+        return _make_claude(self.anthropic_api_key, temperature)
+
 
     def get_embeddings(self):
         """
         Returns embedding model for converting text to vectors
         Used for semantic search in vector databases
+
+        text-embedding-3-small keeps the 1536-dim output our indexes
+        expect but is ~5x cheaper and faster than ada-002; the larger
+        chunk_size packs more inputs per request for batch ingestion
         """
-        return OpenAIEmbeddings(openai_api_key=self.openai_api_key)
+        return _make_embeddings(self.openai_api_key)
@@ -0,0 +1,39 @@
+"""
+Shared HTTP connection pooling for the vector store clients.
+Frequent small operations (hybrid_search, query) are dominated by
+TLS handshakes unless connections are kept alive and reused
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def make_pooled_session(pool_connections: int = 32, pool_maxsize: int = 64,
+                        retries: int = 3) -> requests.Session:
+    """
+    Build a requests.Session with a sized keep-alive pool and retries
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Connections kept alive per host
+        retries: Automatic retries for transient connection errors
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    )
+
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,4 +1,11 @@
 import os
+import asyncio
+import hashlib
+import time
+from uuid import uuid4
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 from dotenv import load_dotenv
 from typing import List, Dict, Any
 from pinecone import Pinecone, ServerlessSpec
@@ -15,36 +22,53 @@ class PineconeStore:
     4. Search by similarity
     """
 
-    def __init__(self, embeddings):
+    def __init__(self, embeddings, namespace: str = None):
         """
         Initialize Pinecone connection
 
         Args:
             embeddings: LangChain embeddings model
+            namespace: Optional Pinecone namespace to scope all reads and
+                       writes to (e.g. a per-test-run namespace, so cleanup
+                       only sweeps the vectors that run added)
         """
 
         self.embeddings = embeddings
         self.index_name = "research-assistant"
+        self.namespace = namespace
 
-        # Initialize Pinecone client (v3+ API)
-        self.pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+        # Initialize Pinecone client (v3+ API) with a worker pool so
+        # async_req upserts/queries reuse kept-alive connections instead
+        # of re-handshaking per call
+        self.pc = Pinecone(
+            api_key=os.getenv("PINECONE_API_KEY"),
+            pool_threads=16
+        )
 
         # Create index if it doesn't exist
         if self.index_name not in self.pc.list_indexes().names():
+            spec = ServerlessSpec(
+                cloud="aws",
+                region="us-east-1"  # Free tier supported region
+            )
+
             self.pc.create_index(
                 name=self.index_name,
                 dimension=1536,  # OpenAI embeddings dimension
                 metric="cosine",
-                spec=ServerlessSpec(
-                    cloud="aws",
-                    region="us-east-1"  # Free tier supported region
-                )
+                spec=spec
             )
 
+        # One shared index handle with its own thread pool: async_req
+        # upserts/queries run over these workers, and we avoid rebuilding
+        # the handle (and its connection state) on every call
+        self.index = self.pc.Index(self.index_name, pool_threads=8)
+
         # Initialize LangChain vectorstore with newer langchain-pinecone
         self.vectorstore = PineconeVectorStore(
             index_name=self.index_name,
-            embedding=self.embeddings
+            embedding=self.embeddings,
+            namespace=self.namespace
         )
 
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -53,34 +77,306 @@ class PineconeStore:
             separators=["\n\n", "\n", ". ", " ", ""]
         )
 
-    def add_documents(self, documents: List[Dict]) -> List[str]:
+        # Optional local copy of upserted vectors for offline scoring and
+        # debugging, kept int8-quantized (4x smaller than fp32) with a
+        # per-vector scale. Off by default; production paths skip it
+        self._cache_local_vectors = os.getenv("PINECONE_LOCAL_VECTOR_CACHE") == "1"
+        self._local_cache = {}
+
+    @staticmethod
+    def _quantize(vector) -> tuple:
         """
-        Add documents to vector store
+        Quantize a vector to int8 with a per-vector scale
+
+        Returns (int8_array, scale) such that int8_array / 127 * scale
+        approximates the original vector
+        """
+        arr = np.asarray(vector, dtype=np.float32)
+        scale = float(np.abs(arr).max()) or 1.0
+        return np.round(arr / scale * 127).astype(np.int8), scale
+
+    def local_scores(self, query: str) -> Dict[str, float]:
+        """
+        Score the locally cached vectors against a query without touching
+        the index
+
+        Dot products run over the int8 representations (widened to int32)
+        and are rescaled afterwards, so the cache stays 4x smaller than
+        fp32. Empty unless PINECONE_LOCAL_VECTOR_CACHE=1 was set during
+        ingestion
 
         Args:
-            documents: List of dicts with 'text' and 'metadata'
+            query: Search query
 
         Returns:
-            List of document IDs
+            Mapping of vector ID to approximate similarity score
+        """
+        if not self._local_cache:
+            return {}
+
+        query_int8, query_scale = self._quantize(self.embeddings.embed_query(query))
+        query_int32 = query_int8.astype(np.int32)
+
+        scores = {}
+        for doc_id, (vector_int8, vector_scale) in self._local_cache.items():
+            dot = int(np.dot(query_int32, vector_int8.astype(np.int32)))
+            scores[doc_id] = dot * (query_scale * vector_scale) / (127 * 127)
+
+        return scores
+
+    @staticmethod
+    def _chunk_id(text: str) -> str:
+        """Deterministic vector ID from chunk content"""
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def _fetch_existing_ids(self, ids: List[str], batch_size: int = 100) -> set:
         """
+        Return the subset of ids already present in the index
+
+        Errors are treated as 'nothing exists' so dedup never blocks
+        ingestion
+        """
+        existing = set()
+        try:
+            for i in range(0, len(ids), batch_size):
+                response = self.index.fetch(ids=ids[i:i + batch_size],
+                                            namespace=self.namespace)
+                existing.update(response.vectors.keys())
+        except Exception:
+            return set()
+        return existing
+
+    def _prepare_chunks(self, documents: List[Dict], chunks: List[List[str]] = None):
+        """
+        Split documents into chunks and build per-chunk metadata
+
+        Args:
+            documents: List of dicts with 'text' and 'metadata'
+            chunks: Pre-split chunk lists, one per document; skips the
+                    splitter pass entirely when supplied
 
+        Returns:
+            (texts, metadatas) ready to embed and upsert
+        """
         texts = []
         metadatas = []
 
-        for doc in documents:
-            #Split long documents into chunks
-            chunks = self.text_splitter.split_text(doc['text'])
+        #Split long documents into chunks. Splitting is pure-Python string
+        #work, so fan it across cores for large corpora; forking a process
+        #pool costs far more than splitting a few short strings saves, so
+        #gate on total text size rather than document count
+        if chunks is not None and len(chunks) == len(documents):
+            all_chunks = chunks
+        elif (len(documents) > 1 and
+              sum(len(doc['text']) for doc in documents) > 500_000):
+            with ProcessPoolExecutor() as executor:
+                all_chunks = list(executor.map(
+                    self.text_splitter.split_text,
+                    [doc['text'] for doc in documents]
+                ))
+        else:
+            all_chunks = [self.text_splitter.split_text(doc['text']) for doc in documents]
 
-            for i, chunk in enumerate(chunks):
+        for doc, doc_chunks in zip(documents, all_chunks):
+            #Build the shared metadata once per document; only chunk_index
+            #varies per chunk, so no need to re-copy the source dict N times
+            base_metadata = {**doc.get('metadata', {}), 'total_chunks': len(doc_chunks)}
+
+            for i, chunk in enumerate(doc_chunks):
                 texts.append(chunk)
-                metadata = doc.get('metadata', {}).copy()
-                metadata['chunk_index'] = i
-                metadata['total_chunks'] = len(chunks)
-                metadatas.append(metadata)
+                metadatas.append({**base_metadata, 'chunk_index': i})
+
+        return texts, metadatas
+
+    def _embed_batched(self, texts: List[str], batch_size: int = 1000) -> List[List[float]]:
+        """
+        Embed texts, dispatching the batches concurrently
+
+        A single embed_documents call works through its internal batches
+        sequentially; for large chunk sets, firing the batches together
+        with aembed_documents + asyncio.gather overlaps the provider
+        round-trips instead of serializing them
+        """
+        if len(texts) <= batch_size:
+            return self.embeddings.embed_documents(texts)
+
+        #Smart batching: sort by length so each batch holds similar-sized
+        #chunks and the embedder pads as little as possible; vectors are
+        #put back in the original order below so metadata still aligns
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+
+        batches = [sorted_texts[i:i + batch_size]
+                   for i in range(0, len(sorted_texts), batch_size)]
+
+        async def embed_all():
+            results = await asyncio.gather(
+                *[self.embeddings.aembed_documents(batch) for batch in batches]
+            )
+            return [vector for batch_vectors in results for vector in batch_vectors]
+
+        sorted_vectors = asyncio.run(embed_all())
+
+        vectors = [None] * len(texts)
+        for position, vector in zip(order, sorted_vectors):
+            vectors[position] = vector
+        return vectors
+
+    def add_documents(self, documents: List[Dict], batch_size: int = 100,
+                      vectors: List[List[float]] = None,
+                      chunks: List[List[str]] = None) -> List[str]:
+        """
+        Add documents to vector store
+
+        Embeds all chunks in one batched request, then upserts the vectors
+        in parallel batches (async_req) instead of letting LangChain embed
+        and upsert sequentially
+
+        Args:
+            documents: List of dicts with 'text' and 'metadata'
+            batch_size: Vectors per upsert batch
+            vectors: Precomputed chunk embeddings, one per resulting chunk;
+                     when supplied (and the count matches) embedding is
+                     skipped entirely
+            chunks: Pre-split chunk lists, one per document; bypasses the
+                    internal splitter when supplied
+
+        Returns:
+            List of document IDs
+        """
+
+        texts, metadatas = self._prepare_chunks(documents, chunks=chunks)
+
+        if not texts:
+            return []
+
+        #Precomputed vectors only make sense if they line up chunk-for-chunk
+        if vectors is not None and len(vectors) != len(texts):
+            vectors = None
 
-        ids = self.vectorstore.add_texts(texts, metadatas)
+        #Content-hash IDs make re-ingestion idempotent: the same chunk
+        #always maps to the same vector ID
+        ids = [self._chunk_id(text) for text in texts]
+
+        #Drop chunks we already hold (within this batch and in the index)
+        #before paying for their embeddings again
+        existing = self._fetch_existing_ids(ids)
+
+        seen = set(existing)
+        new_texts = []
+        new_ids = []
+        new_metadatas = []
+        new_positions = []
+        for position, (doc_id, text, metadata) in enumerate(zip(ids, texts, metadatas)):
+            if doc_id not in seen:
+                seen.add(doc_id)
+                new_ids.append(doc_id)
+                new_texts.append(text)
+                new_metadatas.append(metadata)
+                new_positions.append(position)
+
+        if not new_texts:
+            return ids
+
+        if vectors is not None:
+            vectors = [vectors[position] for position in new_positions]
+        else:
+            #Embed all new chunks, overlapping provider round-trips when
+            #there are several batches
+            vectors = self._embed_batched(new_texts)
+
+        if self._cache_local_vectors:
+            for doc_id, vector in zip(new_ids, vectors):
+                self._local_cache[doc_id] = self._quantize(vector)
+
+        #Store chunk text in metadata so similarity_search can recover it
+        items = [
+            {
+                "id": doc_id,
+                "values": vector,
+                "metadata": {**metadata, "text": text}
+            }
+            for doc_id, text, vector, metadata
+            in zip(new_ids, new_texts, vectors, new_metadatas)
+        ]
+
+        #Fire all upsert batches concurrently, then wait for them to land
+        futures = [
+            self.index.upsert(vectors=items[i:i + batch_size],
+                              namespace=self.namespace, async_req=True)
+            for i in range(0, len(items), batch_size)
+        ]
+        for future in futures:
+            future.get()
+
+        return ids
+
+    async def add_documents_async(self, documents: List[Dict],
+                                  embed_batch_size: int = 256,
+                                  upsert_batch_size: int = 100) -> List[str]:
+        """
+        Add documents with embedding and upserting overlapped
+
+        A producer coroutine embeds chunk batches while consumer coroutines
+        drain a bounded queue and upsert them, so total time is roughly
+        max(embedding, upserting) instead of their sum
+
+        Args:
+            documents: List of dicts with 'text' and 'metadata'
+            embed_batch_size: Chunks per embedding request
+            upsert_batch_size: Vectors per upsert call
+
+        Returns:
+            List of document IDs
+        """
+        texts, metadatas = self._prepare_chunks(documents)
+
+        if not texts:
+            return []
+
+        ids = [str(uuid4()) for _ in texts]
+        loop = asyncio.get_running_loop()
+
+        #Bounded queue applies back-pressure: the embedder can only run a
+        #few batches ahead of the upserters
+        queue = asyncio.Queue(maxsize=4)
+        num_consumers = 2
+
+        async def producer():
+            for start in range(0, len(texts), embed_batch_size):
+                group = texts[start:start + embed_batch_size]
+                vectors = await self.embeddings.aembed_documents(group)
+                await queue.put((start, vectors))
+            #One sentinel per consumer so they all shut down
+            for _ in range(num_consumers):
+                await queue.put(None)
+
+        async def consumer():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                start, vectors = item
+                items = [
+                    {
+                        "id": ids[start + j],
+                        "values": vector,
+                        "metadata": {**metadatas[start + j], "text": texts[start + j]}
+                    }
+                    for j, vector in enumerate(vectors)
+                ]
+                for i in range(0, len(items), upsert_batch_size):
+                    batch = items[i:i + upsert_batch_size]
+                    #Pinecone's client is blocking, so hand it to a thread
+                    await loop.run_in_executor(
+                        None,
+                        lambda b=batch: self.index.upsert(vectors=b,
+                                                          namespace=self.namespace)
+                    )
+
+        await asyncio.gather(producer(), *[consumer() for _ in range(num_consumers)])
         return ids
-    
+
     def search(self, query: str, k: int = 5, filter: Dict = None) -> List[Dict]:
         """
         Search for similar documents
@@ -107,9 +403,114 @@ class PineconeStore:
             })
 
         return formatted
-    
+
+    def search_many(self, queries: List[str], k: int = 5, filter: Dict = None,
+                    rescore: bool = False) -> List[List[Dict]]:
+        """
+        Search for similar documents for several queries at once
+
+        Embeds all queries in one request and fans the index queries out on
+        Pinecone's async_req pool, so N queries cost one embedding round-trip
+        plus the slowest query instead of N serial round-trips
+
+        Args:
+            queries: List of search queries
+            k: Number of results per query
+            filter: Metadata filter applied to every query
+            rescore: Recompute exact cosine scores client-side from the
+                     returned vectors (one BLAS matrix product per query);
+                     useful when the index is quantized and server scores
+                     are approximate
+
+        Returns:
+            List of result lists, one per query, in the same order
+        """
+        #One embedding request for all queries
+        query_vectors = self.embeddings.embed_documents(queries)
+
+        #Fire all queries concurrently, then collect responses in order
+        futures = [
+            self.index.query(
+                vector=vector,
+                top_k=k,
+                include_metadata=True,
+                include_values=rescore,
+                filter=filter,
+                namespace=self.namespace,
+                async_req=True
+            )
+            for vector in query_vectors
+        ]
+        responses = [future.get() for future in futures]
+
+        #Format results to match search()
+        formatted = []
+        for query_vector, response in zip(query_vectors, responses):
+            matches = response.get('matches', [])
+            scores = [match.get('score') for match in matches]
+
+            if rescore and matches:
+                #Stack candidates into a (k, d) matrix and compute all
+                #cosines in one vectorized call instead of per-result
+                #Python float loops
+                matrix = np.asarray([match['values'] for match in matches],
+                                    dtype=np.float32)
+                query = np.asarray(query_vector, dtype=np.float32)
+                norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+                scores = ((matrix @ query) / norms).tolist()
+
+            query_results = []
+            for match, score in zip(matches, scores):
+                metadata = dict(match.get('metadata', {}))
+                query_results.append({
+                    'text': metadata.pop('text', ''),
+                    'metadata': metadata,
+                    'similarity_score': float(score) if score is not None else None
+                })
+            formatted.append(query_results)
+
+        return formatted
+
+    def wait_until_indexed(self, expected_count: int, timeout: float = 10.0,
+                           poll_interval: float = 0.2) -> bool:
+        """
+        Block until the index reports at least expected_count vectors
+
+        Upserts are not immediately queryable; polling the actual stats
+        waits exactly as long as indexing takes instead of a fixed sleep
+
+        Args:
+            expected_count: Minimum number of vectors to wait for
+            timeout: Give up after this many seconds
+            poll_interval: Delay between polls
+
+        Returns:
+            True once the count is reached, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            stats = self.index.describe_index_stats()
+            if self.namespace:
+                summary = stats.namespaces.get(self.namespace)
+                count = summary.vector_count if summary else 0
+            else:
+                count = stats.total_vector_count
+            if count >= expected_count:
+                return True
+            time.sleep(poll_interval)
+
+        return False
+
     def delete_all(self):
-        """Clear all vectors from index"""
-        # Get index reference and delete all vectors
-        index = self.pc.Index(name=self.index_name)
-        index.delete(delete_all=True)
\ No newline at end of file
+        """
+        Clear vectors from the index
+
+        When this store is scoped to a namespace, only that namespace is
+        swept (O(namespace), not O(index)); set PINECONE_FULL_WIPE=1 to
+        force a full-index wipe regardless
+        """
+        if self.namespace and os.getenv("PINECONE_FULL_WIPE") != "1":
+            self.index.delete(delete_all=True, namespace=self.namespace)
+        else:
+            self.index.delete(delete_all=True)
\ No newline at end of file
@@ -1,8 +1,12 @@
 import os
+from functools import lru_cache
 from typing import List, Dict
 from dotenv import load_dotenv
 import weaviate
 from weaviate.auth import AuthApiKey
+from weaviate.util import generate_uuid5
+
+from backend.databases.http_session import make_pooled_session
 
 load_dotenv()
 
@@ -31,6 +35,13 @@ class WeaviateStore:
             auth_client_secret=auth
         )
 
+        # Swap the client's session for one with a sized keep-alive pool,
+        # so repeated small queries reuse TLS connections instead of
+        # re-handshaking. The connection attribute is private, so guard it
+        connection = getattr(self.client, "_connection", None)
+        if connection is not None and hasattr(connection, "_session"):
+            connection._session = make_pooled_session()
+
         # Create schema for research documents
         self._create_schema()
 
@@ -71,32 +82,81 @@ class WeaviateStore:
 
 
 
+    def add_documents(self, documents: List[Dict], batch_size: int = 100,
+                      vectors: List[List[float]] = None) -> List[str]:
+        """
+        Add multiple documents to Weaviate in one batched request
+
+        Uses the client.batch context manager so N documents become a handful
+        of streamed batch calls instead of N separate HTTP round-trips
+
+        Args:
+            documents: List of dictionaries with content, source, title, and other fields
+            batch_size: How many objects to send per batch flush
+            vectors: Precomputed embeddings, one per document; when supplied,
+                     Weaviate skips its server-side vectorizer
+
+        Returns:
+            List of UUIDs for the created documents
+        """
+        if vectors is not None and len(vectors) != len(documents):
+            vectors = None
+        # Dynamic batching lets the client adjust batch size under back-pressure
+        self.client.batch.configure(
+            batch_size=batch_size,
+            dynamic=True,
+            num_workers=4
+        )
+
+        uuids = []
+
+        with self.client.batch as batch:
+            for i, document in enumerate(documents):
+                # Prepare document object with metadata
+                data_object = {
+                    "content": document.get("content", ""),
+                    "source": document.get("source", ""),
+                    "title": document.get("title", ""),
+                    "timestamp": document.get("timestamp", ""),
+                }
+
+                # Deterministic UUID from content, so re-ingesting is idempotent
+                doc_uuid = generate_uuid5(data_object)
+                batch.add_data_object(
+                    data_object,
+                    class_name=self.class_name,
+                    uuid=doc_uuid,
+                    vector=vectors[i] if vectors is not None else None
+                )
+                uuids.append(str(doc_uuid))
+
+        return uuids
+
+
     def add_document(self, document: Dict) -> str:
         """
         Add single document to Weaviate
 
+        Thin wrapper over the batched path so single inserts share the same code
+
         Args:
             document: Dictionary with content, source, title, and other fields
 
         Returns:
             UUID of the created document
         """
-        # Prepare document object with metadata
-        data_object = {
-            "content": document.get("content", ""),
-            "source": document.get("source", ""),
-            "title": document.get("title", ""),
-            "timestamp": document.get("timestamp", ""),
-        }
+        return self.add_documents([document])[0]
 
-        # Add document to Weaviate
-        result = self.client.data_object.create(
-            class_name=self.class_name,
-            data_object=data_object
-        )
 
-        return str(result)
-    
+    @lru_cache(maxsize=1024)
+    def _embed_query(self, query: str) -> tuple:
+        """
+        Embed a query locally, caching repeats
+
+        Returns a tuple so the result is hashable for the LRU cache
+        """
+        return tuple(self.embeddings.embed_query(query))
+
 
     def hybrid_search(self, query: str, limit: int = 5, alpha: float = 0.5) -> List[Dict]:
         """
@@ -110,6 +170,30 @@ class WeaviateStore:
                   - 0.5 = balanced (50% semantic + 50% keyword)
                   - 0.0 = pure keyword/lexical search
 
+        Returns:
+            List of matching documents with metadata
+        """
+        # Supply the query vector ourselves (cached across repeat queries)
+        # so Weaviate doesn't call out to OpenAI server-side on every search
+        vector = list(self._embed_query(query))
+
+        return self.hybrid_search_with_vector(query, vector, limit=limit, alpha=alpha)
+
+
+    def hybrid_search_with_vector(self, query: str, vector: List[float],
+                                  limit: int = 5, alpha: float = 0.5) -> List[Dict]:
+        """
+        Hybrid search with a caller-supplied query vector
+
+        Lets callers embed a query once and reuse the vector across
+        several searches (e.g. the same query at different alphas)
+
+        Args:
+            query: Search query (still used for the keyword side)
+            vector: Precomputed embedding of the query
+            limit: Number of results
+            alpha: Balance between vector (1.0) and keyword (0.0) search
+
         Returns:
             List of matching documents with metadata
         """
@@ -117,7 +201,7 @@ class WeaviateStore:
         result = (
             self.client.query
             .get(self.class_name, ["content", "source", "title", "timestamp"])
-            .with_hybrid(query=query, alpha=alpha)
+            .with_hybrid(query=query, vector=list(vector), alpha=alpha)
             .with_limit(limit)
             .do()
         )
@@ -127,4 +211,3 @@ class WeaviateStore:
             return result["data"]["Get"][self.class_name]
         else:
             return []
-        
\ No newline at end of file
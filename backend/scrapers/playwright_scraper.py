@@ -8,69 +8,134 @@ Playwright runs a real browser, so it can handle:
 
 from playwright.async_api import async_playwright
 import asyncio
-from bs4 import BeautifulSoup
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 class PlaywrightScraper:
     """
     Scrapes websites that require JavaScript execution.
-    Uses headless Chrome for efficiency
+    Uses headless Chrome for efficiency.
+    The browser is launched once and reused across scrapes, since
+    Chromium startup costs ~1-2s per launch
     """
 
-    async def scrape_page(self, url: str, wait_for: Optional[str] = None):
+    #Resource types we never need for text extraction. Stylesheets stay
+    #loaded: innerText respects rendered visibility, so without CSS the
+    #hidden menus/banners/modals would leak into the scraped text
+    BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+    def __init__(self):
+        self._pw = None
+        self._browser = None
+
+    @classmethod
+    async def _block_heavy_resources(cls, route):
+        """Abort requests for images/fonts/media the scraper never reads"""
+        if route.request.resource_type in cls.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _ensure_browser(self):
+        """Launch the shared browser on first use"""
+        if self._browser is None:
+            self._pw = await async_playwright().start()
+            self._browser = await self._pw.chromium.launch(headless=True)
+
+    async def close(self):
+        """Shut down the shared browser and Playwright driver"""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            await self._pw.stop()
+            self._pw = None
+
+    async def scrape_page(self, url: str, wait_for: Optional[str] = None,
+                          want_html: bool = False):
         """
         Scraoe a single page with Playwright
 
         Args:
             url: Page URL
             wait_for: CSS selector to wait for (for dynamic content)
+            want_html: Also return the raw HTML (skipped by default)
         """
 
-        async with async_playwright() as p:
-            
-            browser = await p.chromium.launch(headless = True)
-            page = await browser.new_page()
+        await self._ensure_browser()
 
-            try:
+        #Fresh context per scrape keeps cookies/state isolated, but shares
+        #the already-running browser process
+        context = await self._browser.new_context()
+        page = await context.new_page()
 
-                await page.goto(url, wait_until="networkidle")
+        #Block heavy resources at the network layer -- most of a page's
+        #bytes are images/fonts/trackers that contribute nothing to text
+        await page.route("**/*", self._block_heavy_resources)
 
-                if wait_for:
-                    await page.wait_for_selector(wait_for, timeout=10000)
+        try:
 
-                content = await page.content()
-                title = await page.title()
+            #domcontentloaded fires once the DOM is ready; waiting for
+            #networkidle mostly means waiting on third-party beacons
+            await page.goto(url, wait_until="domcontentloaded")
 
-                soup = BeautifulSoup(content, 'html.parser')
+            if wait_for:
+                await page.wait_for_selector(wait_for, timeout=10000)
 
-                for script in soup.find_all(["script", "style"]):
-                    script.decompose()
+            title = await page.title()
 
-                text = soup.get_text()
+            #Let the browser's renderer extract visible text directly;
+            #innerText already skips scripts/styles and hidden elements,
+            #so there is no HTML to re-parse in Python
+            text = await page.evaluate("() => document.body.innerText")
+            text = ' '.join(text.split())
 
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split(" "))
-                text = ' '.join(chunk for chunk in chunks if chunk)
+            result = {
+                "url": url,
+                "title": title,
+                "text":text,
+                "success": True
+            }
 
-                result = {
-                    "url": url,
-                    "title": title,
-                    "text":text,
-                    "html": content,
-                    "success": True
-                }
-            except Exception as e:
-                result = {
-                    "url": url,
-                    "error": str(e),
-                    "success": False
-                }
+            if want_html:
+                result["html"] = await page.content()
+        except Exception as e:
+            result = {
+                "url": url,
+                "error": str(e),
+                "success": False
+            }
 
-            finally:
-                await browser.close()
+        finally:
+            await context.close()
+
+        return result
+
+    async def scrape_many(self, urls: List[str], wait_for: Optional[str] = None,
+                          max_concurrent: int = 8) -> List[Dict]:
+        """
+        Scrape multiple URLs concurrently over the shared browser
+
+        Args:
+            urls: Page URLs
+            wait_for: CSS selector to wait for on each page
+            max_concurrent: Cap on simultaneous pages
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def bounded_scrape(url):
+            async with semaphore:
+                return await self.scrape_page(url, wait_for)
 
-            return result
+        return await asyncio.gather(*[bounded_scrape(url) for url in urls])
 
     def scrape(self, url: str, wait_for: Optional[str] = None):
         #Synchronous wrapper for async scrape
-        return asyncio.run(self.scrape_page(url, wait_for))
\ No newline at end of file
+        #Tears the browser down afterwards, since it can't outlive the
+        #temporary event loop asyncio.run creates
+        async def _scrape_once():
+            try:
+                return await self.scrape_page(url, wait_for)
+            finally:
+                await self.close()
+
+        return asyncio.run(_scrape_once())
@@ -2,6 +2,7 @@
 
 import os
 import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 
 # Assumes the backend directory is in your Python path.
@@ -45,24 +46,40 @@ def test_playwright_scraper():
     """Test function for PlaywrightScraper (Step 2.2)."""
     print("\nTesting PlaywrightScraper (Step 2.2)...")
     scraper = PlaywrightScraper()
-    test_url = "https://www.google.com"  # A common JavaScript-heavy site
+    test_urls = [
+        "https://www.google.com",  # A common JavaScript-heavy site
+        "https://www.wikipedia.org",
+    ]
+
+    # scrape_many shares one browser launch across all URLs and overlaps
+    # their network waits, instead of a blocking scrape() per URL
+    async def scrape_all():
+        try:
+            return await scraper.scrape_many(test_urls)
+        finally:
+            await scraper.close()
 
-    # Using asyncio.run to execute the async scrape method
     try:
-        result = scraper.scrape(test_url)
+        results = asyncio.run(scrape_all())
 
-        if result.get('success'):
-            print(f"Scrape successful for URL: {result.get('url')}")
-            print(f"Page Title: {result.get('title')}")
-            print(f"Content Length: {len(result.get('text'))} characters")
+        all_succeeded = True
+        for result in results:
+            if result.get('success'):
+                print(f"Scrape successful for URL: {result.get('url')}")
+                print(f"Page Title: {result.get('title')}")
+                print(f"Content Length: {len(result.get('text'))} characters")
+            else:
+                print(f"Scrape failed for URL: {result.get('url')}")
+                print(f"Error: {result.get('error')}")
+                all_succeeded = False
+
+        if all_succeeded:
             print("\nPlaywrightScraper test passed! ✅")
             return True
         else:
-            print(f"Scrape failed for URL: {result.get('url')}")
-            print(f"Error: {result.get('error')}")
             print("\nPlaywrightScraper test failed. ❌")
             return False
-            
+
     except Exception as e:
         print(f"An unexpected error occurred during PlaywrightScraper test: {e} ❌")
         return False
@@ -100,16 +117,16 @@ def test_scrapy_runner():
 
 if __name__ == "__main__":
     print("Starting Module 2 Scraper Tests...")
-    
-    all_passed = True
-    if not test_search_engine():
-        all_passed = False
-    
-    if not test_playwright_scraper():
-        all_passed = False
 
-    if not test_scrapy_runner():
-        all_passed = False
+    # The three tests hit independent backends (SerpAPI, a browser, a
+    # Scrapy crawl) and all block on network, so run them concurrently
+    tests = (test_search_engine, test_playwright_scraper, test_scrapy_runner)
+
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(test): test.__name__ for test in tests}
+        results = {futures[future]: future.result() for future in as_completed(futures)}
+
+    all_passed = all(results.values())
 
     print("\n--- Summary ---")
     if all_passed: